@@ -2,21 +2,12 @@ import streamlit as st
 import semantic_kernel as sk
 from semantic_kernel.connectors.ai.open_ai import AzureTextCompletion
 
-# Create the kernel
-kernel = sk.Kernel()
-
 # Azure OpenAI settings
 OPENAI_ENDPOINT = "*************************************"
 OPENAI_DEPLOYMENT_NAME = "gpt-35-turbo"
 OPENAI_API_KEY = "***********************"
 
-# Add text completion service
-kernel.add_text_completion_service(
-    service_id="gpt-35-turbo",
-    service=AzureTextCompletion("gpt-35-turbo", OPENAI_ENDPOINT, OPENAI_API_KEY)
-)
-
-# Initialize the semantic function
+# Prompt for the semantic function
 prompt = """
 You are a helpful chatbot. Please answer the question based on the given text data.
 Do not make up answers or add anything which is not in context.
@@ -27,29 +18,63 @@ context:
 
 user: {{ $question_str }}
 """
-qa_chat_bot = kernel.create_semantic_function(
-    prompt_template=prompt,
-    description="Answer question based on provided context",
-    max_tokens=100,
-    temperature=0.3,
-    top_p=0.5,
-)
 
-# Streamlit UI
-st.title("Chat With Text Chatbot Using Semantic Kernel")
-st.markdown("<h3 style='text-align: center; color: blue;'>Built for Gen AI</h3>", unsafe_allow_html=True)
 
-context_str = st.text_area("Enter the text data:", height=100)
-question_str = st.text_input("Enter your question:")
+# Create the kernel and semantic function once and reuse them across reruns
+@st.cache_resource
+def get_kernel():
+    kernel = sk.Kernel()
+
+    # Add text completion service
+    kernel.add_text_completion_service(
+        service_id="gpt-35-turbo",
+        service=AzureTextCompletion("gpt-35-turbo", OPENAI_ENDPOINT, OPENAI_API_KEY)
+    )
+
+    qa_chat_bot = kernel.create_semantic_function(
+        prompt_template=prompt,
+        description="Answer question based on provided context",
+        max_tokens=100,
+        temperature=0.3,
+        top_p=0.5,
+    )
+    return kernel, qa_chat_bot
+
+
+kernel, qa_chat_bot = get_kernel()
 
-if st.button("Answer", key="answer_button") and context_str and question_str:
+
+# Reuse the answer when the same text and question are submitted again,
+# keeping at most 100 recent answers for up to an hour
+@st.cache_data(show_spinner=False, max_entries=100, ttl=3600)
+def answer_question(context_str, question_str):
     sk_context = kernel.create_new_context()
     sk_context["context_str"] = context_str
     sk_context["question_str"] = question_str
 
-    answer = qa_chat_bot.invoke(context=sk_context)
+    # Raise on failure so errors are shown but never cached as answers
+    result = qa_chat_bot.invoke(context=sk_context)
+    if result.error_occurred:
+        raise RuntimeError(result.last_error_description)
+
+    return result.result
+
+
+# Streamlit UI
+st.title("Chat With Text Chatbot Using Semantic Kernel")
+st.markdown("<h3 style='text-align: center; color: blue;'>Built for Gen AI</h3>", unsafe_allow_html=True)
+
+context_str = st.text_area("Enter the text data:", height=100)
+question_str = st.text_input("Enter your question:")
 
-    st.subheader("Answer:")
-    st.write(answer)
-elif st.button("Answer", key="warning_button"):
-    st.warning("Please enter the text data and question.")
+if st.button("Answer"):
+    if context_str and question_str:
+        try:
+            answer = answer_question(context_str, question_str)
+        except RuntimeError as e:
+            st.error(f"Error: {e}")
+        else:
+            st.subheader("Answer:")
+            st.write(answer)
+    else:
+        st.warning("Please enter the text data and question.")